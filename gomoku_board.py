@@ -1,41 +1,110 @@
 """
 Gomoku board representation and management
 """
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 import logging
 
 BOARD_SIZE = 15
 BOARD_COLUMNS = tuple("ABCDEFGHIJKLMNO")
 BOARD_COL_TO_INDEX = {col: idx for idx, col in enumerate(BOARD_COLUMNS)}
+BOARD_COLUMN_SET = frozenset(BOARD_COLUMNS)
+
+# All 225 board cells set, for masking bitboard operations
+BOARD_MASK = (1 << BOARD_SIZE * BOARD_SIZE) - 1
+
+# Stone sentinels; single-char literals are interned by CPython, so equality
+# against these constants hits the identity fast path
+EMPTY, BLACK, WHITE = '.', 'B', 'W'
+
+_VALID_STONES = (BLACK, WHITE)
+
+# Byte codes used in the flat board buffer
+_STONE_TO_BYTE = {BLACK: 1, WHITE: 2}
+_BYTE_TO_STONE = (EMPTY, BLACK, WHITE)
+_DISPLAY_TABLE = bytes.maketrans(b'\x00\x01\x02', b'.BW')
+
+# Row-number prefixes ("15 " down to " 1 ") in display order
+_ROW_PREFIXES = tuple(f"{BOARD_SIZE - row_idx:2d} " for row_idx in range(BOARD_SIZE))
+
+# Coordinate names ("A15" .. "O1") indexed by flat bit index
+COORD_NAMES = tuple(f"{chr(65 + c)}{BOARD_SIZE - r}"
+                    for r in range(BOARD_SIZE) for c in range(BOARD_SIZE))
+
+
+def coord_name(col: str, row: int) -> str:
+    """Canonical coordinate name (e.g. 'H8') without building a new string"""
+    return COORD_NAMES[(BOARD_SIZE - row) * BOARD_SIZE + (ord(col) - 65)]
+
+
+def _run_start_mask(col_lo: int, col_hi: int) -> int:
+    """Mask of cells whose column lies in [col_lo, col_hi]"""
+    return sum(1 << (r * BOARD_SIZE + c)
+               for r in range(BOARD_SIZE)
+               for c in range(col_lo, col_hi + 1))
+
+
+# Shift distance per line direction on the flat bitboard (east, south,
+# southeast, southwest in display order), each with a mask of columns where a
+# 5-run may start without wrapping across a row edge
+_WIN_SHIFTS = (
+    (1, _run_start_mask(0, BOARD_SIZE - 5)),
+    (BOARD_SIZE, _run_start_mask(0, BOARD_SIZE - 1)),
+    (BOARD_SIZE + 1, _run_start_mask(0, BOARD_SIZE - 5)),
+    (BOARD_SIZE - 1, _run_start_mask(4, BOARD_SIZE - 1)),
+)
+
+
+def bits_have_five(bb: int) -> bool:
+    """Whether a raw color bitboard contains 5 in a row in any direction"""
+    for shift, mask in _WIN_SHIFTS:
+        m = bb & (bb >> shift)
+        m &= m >> (2 * shift)
+        if m & (bb >> (4 * shift)) & mask:
+            return True
+    return False
 
 
 class GomokuBoard:
     """15x15 Gomoku board with coordinate system A-O (cols) and 1-15 (rows)"""
-    
+
+    __slots__ = ('size', 'black', 'white', 'board', 'move_history', 'cols',
+                 '_rows', '_header', '_display_cache')
+
     def __init__(self):
-        # Initialize 15x15 board with empty spaces
+        # One bitboard per color, one bit per cell (row-major, row 15 first
+        # to match display order). Occupancy tests are single int ops instead
+        # of nested list indexing.
         self.size = BOARD_SIZE
-        self.board = [['.' for _ in range(self.size)] for _ in range(self.size)]
+        self.black = 0
+        self.white = 0
+        # Flat byte-per-cell mirror of the bitboards (0=empty, 1=B, 2=W) for
+        # O(1) cell reads and C-speed rendering
+        self.board = bytearray(BOARD_SIZE * BOARD_SIZE)
         self.move_history = []
-        
-        # Column mapping A-O (15 columns for 15x15 board)
+
+        # Column labels A-O (15 columns for 15x15 board)
         self.cols = BOARD_COLUMNS
-        self.col_to_idx = BOARD_COL_TO_INDEX
-    
+
+        # Pre-rendered display rows, patched in place on each placement so
+        # display() never rescans the board
+        self._rows = [bytearray(b"." + b" ." * (BOARD_SIZE - 1)) for _ in range(BOARD_SIZE)]
+        self._header = "   " + " ".join(BOARD_COLUMNS)
+        # Joined display() string, memoized between moves
+        self._display_cache: Optional[str] = None
+
     def _validate_coordinates(self, col: str, row: int) -> bool:
         """Validate if coordinates are within board bounds"""
-        if col not in self.col_to_idx:
+        # One O(1) set probe also rejects non-strings and multi-char input,
+        # replacing the separate isinstance/length/range checks
+        if col not in BOARD_COLUMN_SET:
             return False
-        if row < 1 or row > self.size:
-            return False
-        return True
-    
-    def _coord_to_indices(self, col: str, row: int) -> Tuple[int, int]:
-        """Convert board coordinates to array indices"""
-        col_idx = self.col_to_idx[col]
-        row_idx = self.size - row  # Convert to 0-based from bottom
-        return row_idx, col_idx
-    
+        return 1 <= row <= self.size
+
+    def _coord_to_index(self, col: str, row: int) -> int:
+        """Convert board coordinates to a flat bit index"""
+        # Row 15 maps to array row 0 (display order, top to bottom)
+        return (self.size - row) * self.size + (ord(col) - 65)
+
     def is_valid_move(self, col: str, row: int) -> Tuple[bool, str]:
         """
         Check if a move is valid
@@ -47,73 +116,95 @@ class GomokuBoard:
                 f"Invalid coordinates: {col}{row}. "
                 f"Column must be {BOARD_COLUMNS[0]}-{BOARD_COLUMNS[-1]}, row must be 1-{self.size}"
             )
-        
+
         # Check if position is empty
-        row_idx, col_idx = self._coord_to_indices(col, row)
-        if self.board[row_idx][col_idx] != '.':
+        idx = self._coord_to_index(col, row)
+        if self.board[idx]:
             return False, f"Position {col}{row} is already occupied"
-        
+
         return True, ""
-    
+
     def place_stone(self, col: str, row: int, stone: str) -> bool:
         """
         Place a stone on the board
         stone: 'B' for black, 'W' for white
         Returns: True if successful, False otherwise
         """
-        logging.debug(f"Attempting to place {stone} stone at {col}{row}")
-        
+        logging.debug("Attempting to place %s stone at %s%s", stone, col, row)
+
         is_valid, error_msg = self.is_valid_move(col, row)
         if not is_valid:
             logging.error(f"Invalid move: {error_msg}")
             print(f"Invalid move: {error_msg}")
             return False
-        
-        if stone not in ['B', 'W']:
+
+        if stone not in _VALID_STONES:
             logging.error(f"Invalid stone type: {stone}. Must be 'B' or 'W'")
             print(f"Invalid stone type: {stone}. Must be 'B' or 'W'")
             return False
-        
-        row_idx, col_idx = self._coord_to_indices(col, row)
-        logging.debug(f"Converting {col}{row} to array indices: [{row_idx}][{col_idx}]")
-        logging.debug(f"Current value at [{row_idx}][{col_idx}]: '{self.board[row_idx][col_idx]}'")
-        
-        self.board[row_idx][col_idx] = stone
+
+        idx = self._coord_to_index(col, row)
+
+        if stone == BLACK:
+            self.black |= 1 << idx
+        else:
+            self.white |= 1 << idx
+        self.board[idx] = _STONE_TO_BYTE[stone]
+        row_idx, col_idx = divmod(idx, self.size)
+        self._rows[row_idx][col_idx * 2] = ord(stone)
+        self._display_cache = None
         self.move_history.append((col, row, stone))
-        
-        logging.debug(f"Successfully placed {stone} at {col}{row}")
-        logging.debug(f"Updated move history: {self.move_history}")
-        
+
+        logging.debug("Successfully placed %s at %s%s", stone, col, row)
+
         return True
-    
+
     def get_stone(self, col: str, row: int) -> Optional[str]:
         """Get the stone at given coordinates"""
         if not self._validate_coordinates(col, row):
             return None
-        
-        row_idx, col_idx = self._coord_to_indices(col, row)
-        stone = self.board[row_idx][col_idx]
-        return stone if stone != '.' else None
-    
+
+        idx = self._coord_to_index(col, row)
+        stone = self.board[idx]
+        return _BYTE_TO_STONE[stone] if stone else None
+
+    def stone_at(self, row_idx: int, col_idx: int) -> str:
+        """Get the cell content ('B', 'W' or '.') at array indices"""
+        return _BYTE_TO_STONE[self.board[row_idx * self.size + col_idx]]
+
     def display(self) -> str:
         """Display the board in the specified format"""
-        lines = []
-        
-        for row_num in range(self.size, 0, -1):  # 15 to 1
-            row_idx = self.size - row_num
-            line = f"{row_num:2d} "
-            
-            for col_idx in range(self.size):
-                line += self.board[row_idx][col_idx] + " "
-            
-            lines.append(line.rstrip())
-        
-        # Add column headers
-        header = "   " + " ".join(self.cols)
-        lines.append(header)
-        
-        return "\n".join(lines)
-    
+        # Rejoin only after a placement invalidated the cache, so repeated
+        # renders of the same position (logging, prompts) are free
+        if self._display_cache is None:
+            lines = [prefix + row.decode()
+                     for prefix, row in zip(_ROW_PREFIXES, self._rows)]
+            lines.append(self._header)
+            self._display_cache = "\n".join(lines)
+        return self._display_cache
+
+    def has_five_in_row(self, stone: str) -> bool:
+        """
+        Check whether the given color ('B' or 'W') has 5 in a row anywhere.
+        Constant-time shift-and-AND chains on the color bitboard.
+        """
+        return bits_have_five(self.black if stone == BLACK else self.white)
+
+    def stones_by_color(self) -> Tuple[List[str], List[str]]:
+        """Coordinate names of all black and white stones, in board order"""
+        return (self._bitboard_names(self.black),
+                self._bitboard_names(self.white))
+
+    @staticmethod
+    def _bitboard_names(bb: int) -> List[str]:
+        """Coordinate names for every set bit of a color bitboard"""
+        names = []
+        while bb:
+            bit = bb & -bb
+            bb ^= bit
+            names.append(COORD_NAMES[bit.bit_length() - 1])
+        return names
+
     def get_last_move(self) -> Optional[Tuple[str, int, str]]:
         """Get the last move played"""
         return self.move_history[-1] if self.move_history else None
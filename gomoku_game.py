@@ -1,14 +1,15 @@
 """
 Main Gomoku game runner with multi-model LLM vs LLM gameplay
 """
-import time
+import asyncio
+import os
 import logging
 import json
 import argparse
 from datetime import datetime
 from typing import Optional
 from dotenv import load_dotenv
-from gomoku_board import GomokuBoard
+from gomoku_board import GomokuBoard, coord_name
 from win_checker import WinChecker
 from llm_player import LLMPlayer
 from model_config import ModelManager, get_model_display_name
@@ -16,22 +17,37 @@ from model_config import ModelManager, get_model_display_name
 # Load environment variables from .env file (override system env vars)
 load_dotenv(override=True)
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+# Configure logging (default WARNING; override via GOMOKU_LOG_LEVEL or --debug)
+logging.basicConfig(level=os.environ.get("GOMOKU_LOG_LEVEL", "WARNING"),
+                    format='%(asctime)s - %(levelname)s - %(message)s')
 
 
 class GomokuGame:
     """Main game controller for multi-model LLM vs LLM Gomoku"""
-    
-    def __init__(self, black_model: str = None, white_model: str = None):
+
+    __slots__ = ('board', 'win_checker', 'model_manager', 'black_player',
+                 'white_player', 'current_player', 'game_over', 'winner',
+                 'game_record', 'move_delay', '_record_base', '_record_fp',
+                 '_player_infos', '_move_count', '_record_moves',
+                 '_prefetch')
+
+    def __init__(self, black_model: str = None, white_model: str = None,
+                 move_delay: float = 1.0, record_moves: bool = True,
+                 use_local_oracle: bool = False):
         """
         Initialize the game with models configured from environment variables or command line
-        
+
         Args:
             black_model: Optional model name for black player (e.g., 'gpt-5')
             white_model: Optional model name for white player (e.g., 'gemini-2.5-flash')
+            move_delay: Seconds to pause before each move for readability (0 disables)
+            record_moves: When False, skip per-move recording and save only the result
+            use_local_oracle: Let players take forced wins/blocks found by a
+                local bitboard scan without an API call (off for benchmarks)
         """
         self.board = GomokuBoard()
+        self.move_delay = move_delay
+        self._record_moves = bool(record_moves)
         self.win_checker = WinChecker(self.board)
         
         # Initialize model manager
@@ -54,8 +70,10 @@ class GomokuGame:
             else:
                 white_config = self.model_manager.get_player_config("W")
             
-            self.black_player = LLMPlayer(black_config, "B")
-            self.white_player = LLMPlayer(white_config, "W")
+            self.black_player = LLMPlayer(black_config, "B",
+                                          use_local_oracle=use_local_oracle)
+            self.white_player = LLMPlayer(white_config, "W",
+                                          use_local_oracle=use_local_oracle)
             
         except ValueError as e:
             raise ValueError(f"Model configuration error: {e}")
@@ -88,51 +106,90 @@ class GomokuGame:
                 "game_end_reason": None
             }
         }
-    
+
+        # Count of recorded moves; single source of truth for total_moves
+        self._move_count = 0
+
+        # Overlap next-turn prompt assembly with end-of-turn bookkeeping:
+        # after a move, the opponent's board-state message is built by an
+        # asyncio task and awaited at the start of their turn
+        self._prefetch = None
+
+        # Cache player-info references so record_move doesn't re-select per call
+        self._player_infos = {
+            "B": self.game_record["game_info"]["black_player"],
+            "W": self.game_record["game_info"]["white_player"]
+        }
+
+        # Stream the record incrementally to a JSONL file (one line per move)
+        # so long games don't rely on the final dump surviving to game end
+        self._record_base = self._generate_record_basename()
+        self._record_fp = None
+        if self._record_moves:
+            try:
+                self._record_fp = open(f"{self._record_base}.jsonl", 'w', encoding='utf-8')
+                self._record_fp.write(json.dumps(
+                    {"game_info": self.game_record["game_info"]}, ensure_ascii=False) + "\n")
+            except Exception as e:
+                logging.warning("Could not open streaming game record: %s", e)
+
+    def _generate_record_basename(self) -> str:
+        """Build the timestamp/player-based base filename for game records"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        black_model = self.game_record["game_info"]["black_player"]["model"]
+        white_model = self.game_record["game_info"]["white_player"]["model"]
+
+        # Sanitize model names for filename (replace invalid chars with underscores)
+        black_model_safe = black_model.replace("/", "_").replace("\\", "_").replace(":", "_")
+        white_model_safe = white_model.replace("/", "_").replace("\\", "_").replace(":", "_")
+
+        return f"gomoku_game_{timestamp}_{black_model_safe}_vs_{white_model_safe}"
+
     def _print_configuration_status(self, config_status, black_model=None, white_model=None):
         """Print the current model configuration status"""
-        print("\n🤖 Model Configuration Status")
-        print("=" * 50)
-        
+        # Build the whole block and print once instead of a dozen print calls
+        lines = ["\n🤖 Model Configuration Status", "=" * 50]
+
         # Show command line specified models if available
         if black_model or white_model:
-            print("Command Line Configuration:")
+            lines.append("Command Line Configuration:")
             if black_model:
                 try:
                     provider = self.model_manager.find_provider_for_model(black_model)
                     display_name = get_model_display_name(provider, black_model)
-                    print(f"Black Player: {provider}/{black_model} ({display_name})")
+                    lines.append(f"Black Player: {provider}/{black_model} ({display_name})")
                 except ValueError:
-                    print(f"Black Player: {black_model} (❌ Not Found)")
+                    lines.append(f"Black Player: {black_model} (❌ Not Found)")
             else:
                 black_info = config_status["black_player"]
-                print(f"Black Player: {black_info['provider']}/{black_info['model']} (from .env)")
-                
+                lines.append(f"Black Player: {black_info['provider']}/{black_info['model']} (from .env)")
+
             if white_model:
                 try:
                     provider = self.model_manager.find_provider_for_model(white_model)
                     display_name = get_model_display_name(provider, white_model)
-                    print(f"White Player: {provider}/{white_model} ({display_name})")
+                    lines.append(f"White Player: {provider}/{white_model} ({display_name})")
                 except ValueError:
-                    print(f"White Player: {white_model} (❌ Not Found)")
+                    lines.append(f"White Player: {white_model} (❌ Not Found)")
             else:
                 white_info = config_status["white_player"]
-                print(f"White Player: {white_info['provider']}/{white_info['model']} (from .env)")
+                lines.append(f"White Player: {white_info['provider']}/{white_info['model']} (from .env)")
         else:
-            print("Environment Variable Configuration:")
+            lines.append("Environment Variable Configuration:")
             black_info = config_status["black_player"]
             white_info = config_status["white_player"]
-            
-            print(f"Black Player: {black_info['provider']}/{black_info['model']}")
-            print(f"  Status: {'✅ Configured' if black_info['configured'] else '❌ Not Configured'}")
-            
-            print(f"White Player: {white_info['provider']}/{white_info['model']}")
-            print(f"  Status: {'✅ Configured' if white_info['configured'] else '❌ Not Configured'}")
-        
-        print(f"\nConfigured Providers: {config_status['configured_providers']}")
-        print(f"Total Available Providers: {config_status['total_providers']}")
-        print()
-        
+
+            lines.append(f"Black Player: {black_info['provider']}/{black_info['model']}")
+            lines.append(f"  Status: {'✅ Configured' if black_info['configured'] else '❌ Not Configured'}")
+
+            lines.append(f"White Player: {white_info['provider']}/{white_info['model']}")
+            lines.append(f"  Status: {'✅ Configured' if white_info['configured'] else '❌ Not Configured'}")
+
+        lines.append(f"\nConfigured Providers: {config_status['configured_providers']}")
+        lines.append(f"Total Available Providers: {config_status['total_providers']}")
+        lines.append("")
+        print("\n".join(lines))
+
     def switch_player(self):
         """Switch to the other player"""
         self.current_player = (self.white_player if self.current_player == self.black_player 
@@ -140,27 +197,34 @@ class GomokuGame:
     
     def record_move(self, column: str, row: int, player_color: str):
         """Record a move in the game record"""
-        move_number = len(self.game_record["moves"]) + 1
-        player_info = (self.game_record["game_info"]["black_player"] 
-                      if player_color == "B" 
-                      else self.game_record["game_info"]["white_player"])
-        
+        self._move_count += 1
+        if not self._record_moves:
+            return
+
+        move_number = self._move_count
+        player_info = self._player_infos[player_color]
+
         move_record = {
             "move_number": move_number,
             "player": player_color,
             "player_name": player_info["display_name"],
             "column": column,
             "row": row,
-            "coordinate": f"{column}{row}"
+            "coordinate": coord_name(column, row)
         }
         
         self.game_record["moves"].append(move_record)
-    
+
+        if self._record_fp:
+            self._record_fp.write(json.dumps(move_record, ensure_ascii=False) + "\n")
+            self._record_fp.flush()
+
     def display_game_state(self):
         """Display current game state"""
-        color_name = "Black" if self.current_player.stone_color == 'B' else 'White'
+        player = self.current_player
+        color_name = "Black" if player.stone_color == 'B' else 'White'
         print("\n" + "="*60)
-        print(f"GOMOKU GAME - {color_name}'s Turn ({self.current_player.display_name})")
+        print(f"GOMOKU GAME - {color_name}'s Turn ({player.display_name})")
         print("="*60)
         print(self.board.display())
         print()
@@ -180,7 +244,7 @@ class GomokuGame:
             column, row = last_move
             stone = self.current_player.stone_color
             
-            if self.win_checker.check_win(column, row, stone):
+            if self.board.has_five_in_row(stone):
                 self.winner = stone
                 self.game_over = True
                 
@@ -191,29 +255,30 @@ class GomokuGame:
                 # Record the game result
                 self.game_record["result"]["winner"] = color_name
                 self.game_record["result"]["winner_color"] = stone
-                self.game_record["result"]["total_moves"] = len(self.game_record["moves"])
+                self.game_record["result"]["total_moves"] = self._move_count
                 self.game_record["result"]["game_end_reason"] = f"{color_name} achieved 5 in a row"
-                if winning_line:
+                if winning_line and self._record_moves:
                     self.game_record["result"]["winning_line"] = [
-                        {"column": col, "row": row, "coordinate": f"{col}{row}"} 
+                        {"column": col, "row": row, "coordinate": coord_name(col, row)}
                         for col, row in winning_line
                     ]
-                
+
                 print(f"\n🎉 GAME OVER! {color_name} wins! 🎉")
                 if winning_line:
-                    line_str = " → ".join([f"{col}{row}" for col, row in winning_line])
+                    line_str = " → ".join([coord_name(col, row) for col, row in winning_line])
                     print(f"Winning line: {line_str}")
                 
                 return True
         
-        # Check for draw (board full)
-        if self.win_checker.is_board_full():
+        # Check for draw (board full). Every successful placement appends to
+        # move_history, so a length check replaces the 225-cell scan.
+        if len(self.board.move_history) >= self.board.size * self.board.size:
             self.game_over = True
             
             # Record the draw result
             self.game_record["result"]["winner"] = "Draw"
             self.game_record["result"]["winner_color"] = None
-            self.game_record["result"]["total_moves"] = len(self.game_record["moves"])
+            self.game_record["result"]["total_moves"] = self._move_count
             self.game_record["result"]["game_end_reason"] = "Board is full - Draw"
             
             print("\n🤝 GAME OVER! It's a draw! 🤝")
@@ -221,27 +286,41 @@ class GomokuGame:
         
         return False
     
-    def play_turn(self) -> bool:
+    async def play_turn(self) -> bool:
         """
         Play one turn of the game
-        
+
         Returns:
             True if turn was successful, False if there was an error
         """
-        color_name = "Black" if self.current_player.stone_color == "B" else "White"
-        print(f"\n{color_name} ({self.current_player.display_name}) is thinking...")
+        player = self.current_player
+        stone_color = player.stone_color
+        color_name = "Black" if stone_color == "B" else "White"
+        print(f"\n{color_name} ({player.display_name}) is thinking...")
         
-        logging.debug(f"=== Starting turn for {color_name} ===")
-        logging.debug(f"Current board state:\n{self.board.display()}")
-        logging.debug(f"Move history: {self.board.move_history}")
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("=== Starting turn for %s ===", color_name)
+            logging.debug("Current board state:\n%s", self.board.display())
+            logging.debug("Move history: %s", self.board.move_history)
         
         # Add a small delay for readability
-        time.sleep(1)
-        
+        if self.move_delay:
+            await asyncio.sleep(self.move_delay)
+        
+        # Use the board message prefetched at the end of the previous turn
+        board_message = None
+        if self._prefetch is not None:
+            try:
+                board_message = await self._prefetch
+            except Exception as e:
+                logging.warning("Prompt prefetch failed, rebuilding: %s", e)
+            self._prefetch = None
+
         try:
-            success, message, move_coords = self.current_player.play_turn(self.board, max_retries=3)
+            success, message, move_coords = await player.play_turn(
+                self.board, max_retries=3, board_message=board_message)
             
-            logging.debug(f"Turn result - Success: {success}, Message: {message}, Coords: {move_coords}")
+            logging.debug("Turn result - Success: %s, Message: %s, Coords: %s", success, message, move_coords)
             
             if success:
                 print(f"✓ {message}")
@@ -249,7 +328,7 @@ class GomokuGame:
                 # Record the successful move
                 if move_coords:
                     column, row = move_coords
-                    self.record_move(column, row, self.current_player.stone_color)
+                    self.record_move(column, row, stone_color)
                 
                 # Check if this move ends the game
                 if self.check_game_end(move_coords):
@@ -257,7 +336,12 @@ class GomokuGame:
                 
                 # Switch to the other player
                 self.switch_player()
-                logging.debug(f"Switched to player: {self.current_player.stone_color}")
+                logging.debug("Switched to player: %s", self.current_player.stone_color)
+
+                # The board is final for the opponent's turn, so their prompt
+                # can be assembled concurrently with the inter-move pause
+                self._prefetch = asyncio.create_task(asyncio.to_thread(
+                    self.current_player._get_board_state_message, self.board))
                 return True
             else:
                 print(f"✗ {message}")
@@ -267,13 +351,13 @@ class GomokuGame:
                 if "loses - Failed to make valid move" in message:
                     self.game_over = True
                     # Set the winner as the opponent
-                    self.winner = "W" if self.current_player.stone_color == "B" else "B"
+                    self.winner = "W" if stone_color == "B" else "B"
                     winner_name = "White" if self.winner == "W" else "Black"
                     
                     # Record the forfeit result
                     self.game_record["result"]["winner"] = winner_name
                     self.game_record["result"]["winner_color"] = self.winner
-                    self.game_record["result"]["total_moves"] = len(self.game_record["moves"])
+                    self.game_record["result"]["total_moves"] = self._move_count
                     self.game_record["result"]["game_end_reason"] = f"{color_name} forfeited - failed to make valid move after retries"
                     
                     print(f"\n🏆 GAME OVER! {winner_name} wins by forfeit! 🏆")
@@ -286,7 +370,7 @@ class GomokuGame:
                     # Record the error result
                     self.game_record["result"]["winner"] = "Error"
                     self.game_record["result"]["winner_color"] = None
-                    self.game_record["result"]["total_moves"] = len(self.game_record["moves"])
+                    self.game_record["result"]["total_moves"] = self._move_count
                     self.game_record["result"]["game_end_reason"] = f"Game ended due to error: {message}"
                     
                     return False
@@ -299,7 +383,7 @@ class GomokuGame:
             # Record the exception result
             self.game_record["result"]["winner"] = "Error"
             self.game_record["result"]["winner_color"] = None
-            self.game_record["result"]["total_moves"] = len(self.game_record["moves"])
+            self.game_record["result"]["total_moves"] = self._move_count
             self.game_record["result"]["game_end_reason"] = f"Game ended due to exception: {str(e)}"
             
             return False
@@ -315,17 +399,18 @@ class GomokuGame:
             The filename of the saved file
         """
         if filename is None:
-            # Generate filename based on timestamp and players
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            black_model = self.game_record["game_info"]["black_player"]["model"]
-            white_model = self.game_record["game_info"]["white_player"]["model"]
-            
-            # Sanitize model names for filename (replace invalid chars with underscores)
-            black_model_safe = black_model.replace("/", "_").replace("\\", "_").replace(":", "_")
-            white_model_safe = white_model.replace("/", "_").replace("\\", "_").replace(":", "_")
-            
-            filename = f"gomoku_game_{timestamp}_{black_model_safe}_vs_{white_model_safe}.json"
-        
+            filename = f"{self._record_base}.json"
+
+        # Finish the streaming record with the result line
+        if self._record_fp:
+            try:
+                self._record_fp.write(json.dumps(
+                    {"result": self.game_record["result"]}, ensure_ascii=False) + "\n")
+                self._record_fp.close()
+            except Exception as e:
+                logging.warning("Could not finalize streaming game record: %s", e)
+            self._record_fp = None
+
         try:
             with open(filename, 'w', encoding='utf-8') as f:
                 json.dump(self.game_record, f, indent=2, ensure_ascii=False)
@@ -337,7 +422,7 @@ class GomokuGame:
             print(f"❌ Error saving game record: {e}")
             return None
     
-    def play_game(self, max_moves: int = 225) -> str:
+    async def play_game(self, max_moves: int = 225) -> str:
         """
         Play a complete game
         
@@ -356,14 +441,14 @@ class GomokuGame:
         while not self.game_over and move_count < max_moves:
             self.display_game_state()
             
-            if not self.play_turn():
+            if not await self.play_turn():
                 break
-            
+
             move_count += 1
-            
+
             # Add a pause between moves for better readability
-            if not self.game_over:
-                time.sleep(0.5)
+            if not self.game_over and self.move_delay:
+                await asyncio.sleep(self.move_delay * 0.5)
         
         # Final game state
         self.display_game_state()
@@ -377,7 +462,7 @@ class GomokuGame:
             if self.game_record["result"]["winner"] is None:
                 self.game_record["result"]["winner"] = "Draw"
                 self.game_record["result"]["winner_color"] = None
-                self.game_record["result"]["total_moves"] = len(self.game_record["moves"])
+                self.game_record["result"]["total_moves"] = self._move_count
                 self.game_record["result"]["game_end_reason"] = "Maximum moves reached"
             result = "Draw - Maximum moves reached"
         else:
@@ -386,6 +471,11 @@ class GomokuGame:
         print(f"\n📊 FINAL RESULT: {result}")
         print(f"Total moves played: {move_count}")
         
+        # Drop any prompt prefetched for a turn that will never happen
+        if self._prefetch is not None:
+            self._prefetch.cancel()
+            self._prefetch = None
+
         # Save the game record to JSON
         saved_file = self.save_game_record()
         if saved_file:
@@ -430,7 +520,34 @@ Examples:
     )
     
     parser.add_argument(
-        "--list-models", 
+        "--delay",
+        type=float,
+        default=1.0,
+        help="Seconds to pause before each move for readability (use 0 for benchmark runs)"
+    )
+
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Enable DEBUG logging"
+    )
+
+    parser.add_argument(
+        "--no-record",
+        action="store_false",
+        dest="record_moves",
+        help="Skip per-move recording; only the final result is saved"
+    )
+
+    parser.add_argument(
+        "--local-oracle",
+        action="store_true",
+        dest="use_local_oracle",
+        help="Play forced wins/blocks locally instead of querying the LLM"
+    )
+
+    parser.add_argument(
+        "--list-models",
         action="store_true", 
         help="List all available models and exit"
     )
@@ -441,29 +558,34 @@ def main():
     """Main function to run the game"""
     parser = create_argument_parser()
     args = parser.parse_args()
-    
+
+    if args.debug:
+        logging.getLogger().setLevel(logging.DEBUG)
+
     try:
         # Handle list models command
         if args.list_models:
             manager = ModelManager()
-            print("\n🤖 Available Models:")
-            print("=" * 50)
-            
+            lines = ["\n🤖 Available Models:", "=" * 50]
+
             for provider, models in manager.PROVIDER_MODELS.items():
                 status = "✅ Configured" if provider in manager.configs else "❌ Not Configured"
-                print(f"\n{provider.upper()} ({status}):")
+                lines.append(f"\n{provider.upper()} ({status}):")
                 for model in models:
                     display_name = get_model_display_name(provider, model)
-                    print(f"  • {model} ({display_name})")
-            
-            print(f"\n💡 Usage examples:")
-            print(f"  python gomoku_game.py -b gpt-5 -w gemini-2.5-flash")
-            print(f"  python gomoku_game.py -b deepseek-chat -w glm-4.5")
+                    lines.append(f"  • {model} ({display_name})")
+
+            lines.append("\n💡 Usage examples:")
+            lines.append("  python gomoku_game.py -b gpt-5 -w gemini-2.5-flash")
+            lines.append("  python gomoku_game.py -b deepseek-chat -w glm-4.5")
+            print("\n".join(lines))
             return
         
         # Create and run the game
-        game = GomokuGame(black_model=args.black, white_model=args.white)
-        result = game.play_game()
+        game = GomokuGame(black_model=args.black, white_model=args.white,
+                          move_delay=args.delay, record_moves=args.record_moves,
+                          use_local_oracle=args.use_local_oracle)
+        result = asyncio.run(game.play_game())
         
         print(f"\nGame completed with result: {result}")
         
@@ -4,19 +4,50 @@ A GUI tool to visualize and replay LLM vs LLM Gomoku games from JSON files
 """
 
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk, messagebox
 import json
 import os
 import glob
-from typing import Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
 from gomoku_board import BOARD_COL_TO_INDEX, BOARD_COLUMNS, BOARD_SIZE
 
+# orjson is optional: its C parser decodes large replay files noticeably
+# faster than the stdlib json module
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Pillow is optional: when present, the static board is pre-rendered to one
+# off-screen image and blitted as a single canvas item, which avoids the
+# white flash of rebuilding ~90 line/text items on full repaints
+try:
+    from PIL import Image, ImageDraw, ImageTk
+    _HAS_PIL = True
+except ImportError:
+    _HAS_PIL = False
+
+# Byte codes for the flat board-state buffer (matches gomoku_board's scheme)
+_EMPTY_CODE, _BLACK_CODE, _WHITE_CODE = 0, 1, 2
+
+# Translation table for turning filename underscores into spaces in one pass
+_UND_TBL = str.maketrans('_', ' ')
+
+# On-disk manifest written next to each game folder so later runs can skip
+# the directory walk when nothing changed
+_INDEX_NAME = '.game_index.json'
+
 
 class GomokuVisualizer:
     """GUI application for visualizing Gomoku game replays"""
     
     def __init__(self, root):
         self.root = root
+        # Cache of discovered game files per folder, filled by _scan_games
+        self._folder_cache = {}
         # Auto-detect best default folder
         self.current_folder = self._detect_default_folder()
         self.root.title(f"LLM Gomoku Game Visualizer - {self.current_folder}")
@@ -40,16 +71,61 @@ class GomokuVisualizer:
             'winning_stone': '#FF0000',  # Red highlight for winning stones
             'last_move': '#00FF00'  # Green highlight for last move
         }
-        
-        # Board state for current move
-        self.board_state = [['.' for _ in range(self.board_size)] for _ in range(self.board_size)]
-        self.move_numbers = [[0 for _ in range(self.board_size)] for _ in range(self.board_size)]  # Track move numbers
-        self.winning_positions = []
+
+        # Shared Font objects and per-code fill colors: passing the same Font
+        # instance lets Tk reuse the resolved font instead of reparsing an
+        # ('Arial', size, 'bold') tuple for every text item
+        self._fonts = {size: tkfont.Font(family='Arial', size=size, weight='bold')
+                       for size in (10, 12, 14)}
+        self._stone_fill = {_BLACK_CODE: self.colors['black'],
+                            _WHITE_CODE: self.colors['white']}
+
+        # Board state for current move: flat byte-per-cell buffers
+        # (row_idx * 15 + col_idx) instead of nested lists of PyObjects
+        n_cells = self.board_size * self.board_size
+        self.board_state = bytearray(n_cells)
+        self.move_numbers = bytearray(n_cells)  # Track move numbers (max 225 fits a byte)
+        # (col, row) coordinate pairs of the winning line; a frozenset keeps
+        # the per-cell membership test in draw_stones O(1)
+        self.winning_positions = frozenset()
+        self._undo_stack = []  # flat cell index per applied move
+        self._move_cells = []  # (cell, code, move_number) per move, built at load
+        self._moves = []  # cached game_data['moves'] list
+        self._n_moves = 0
+        self._move_tags = ()  # 'm{i}' canvas tags, precomputed at load
         
         # GUI elements
         self.canvas = None
         self.info_frame = None
         self.control_frame = None
+
+        # Canvas item bookkeeping for incremental redraws: the static grid
+        # and labels are created once, and stones are added/removed by diff
+        self._static_drawn = False
+        self._stone_items = {}  # (row_idx, col_idx) -> (oval_id, stone_code)
+        self._visible_upto = 0  # moves currently shown (stones are pre-created hidden)
+        # (row_idx, col_idx) -> (outline, width) for stones whose oval is
+        # currently highlighted via itemconfigure
+        self._currently_highlighted = {}
+        self._bg_img = None  # PhotoImage reference for the pre-rendered board
+        # Tcl command templates for stone creation, built once the canvas
+        # exists; %-formatting into these skips per-item kwarg marshalling
+        self._oval_tmpl = None
+        self._text_tmpl = None
+
+        # Redraws are coalesced through after_idle so a burst of navigation
+        # events (e.g. held arrow key) paints at most once per idle cycle
+        self._redraw_pending = False
+
+        # Keyboard autorepeat debounce: held navigation keys accumulate a
+        # step delta that one ~60Hz after() tick consumes in a single update
+        self._pending_delta = 0
+        self._tick_scheduled = False
+
+        # Game files are read and parsed off the Tk main loop; the generation
+        # counter discards loads superseded by a newer selection
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        self._load_generation = 0
         
         self.setup_gui()
         self.load_available_games()
@@ -57,18 +133,86 @@ class GomokuVisualizer:
     def _detect_default_folder(self):
         """Auto-detect the best default folder based on available games"""
         folders_to_check = ["qwen3", "gpt5", "r1", "round1"]
-        
+
         for folder in folders_to_check:
-            if os.path.exists(folder):
-                if folder in ["qwen3", "gpt5"]:
-                    json_files = glob.glob(os.path.join(folder, "*.json"))
-                else:
-                    json_files = glob.glob(os.path.join(folder, "*", "*.json"))
-                if json_files:
-                    return folder
-        
+            if self._scan_games(folder):
+                return folder
+
         # Fallback to round1 if no folder has games
         return "round1"
+
+    def _scan_games(self, folder):
+        """
+        Discover game JSON files in a folder (directly or one level down),
+        memoized per folder and backed by an on-disk manifest
+        """
+        cached = self._folder_cache.get(folder)
+        if cached is not None:
+            return cached
+
+        paths = self._load_or_build_index(folder)
+        self._folder_cache[folder] = paths
+        return paths
+
+    def _walk_folder(self, folder):
+        """Scan a folder for game files; returns (paths, subdir mtimes)"""
+        paths = []
+        sub_mtimes = {}
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    # DirEntry caches its stat data, so these checks don't
+                    # repeat syscalls the way glob does
+                    if (entry.name.endswith('.json') and entry.name != _INDEX_NAME
+                            and entry.is_file(follow_symlinks=False)):
+                        paths.append(entry.path)
+                    elif entry.is_dir(follow_symlinks=False):
+                        sub_mtimes[entry.path] = entry.stat().st_mtime
+                        with os.scandir(entry.path) as sub:
+                            for f in sub:
+                                if f.name.endswith('.json') and f.is_file(follow_symlinks=False):
+                                    paths.append(f.path)
+        except OSError:
+            pass
+
+        paths.sort()
+        return paths, sub_mtimes
+
+    def _load_or_build_index(self, folder):
+        """
+        Return the folder's game files from its .game_index.json manifest
+        when the recorded mtimes still match, rebuilding it otherwise. This
+        turns the "any new games?" check into a handful of stat calls.
+        """
+        try:
+            dir_mtime = os.stat(folder).st_mtime
+        except OSError:
+            return []  # Folder missing: nothing to scan or index
+
+        idx_path = os.path.join(folder, _INDEX_NAME)
+        try:
+            with open(idx_path, 'rb') as f:
+                index = _loads(f.read())
+            if (index.get('mtime') == dir_mtime and
+                    all(os.stat(sub).st_mtime == mtime
+                        for sub, mtime in index.get('sub_mtimes', {}).items())):
+                return index.get('files', [])
+        except (OSError, ValueError):
+            pass
+
+        paths, sub_mtimes = self._walk_folder(folder)
+        try:
+            with open(idx_path, 'w', encoding='utf-8') as f:
+                # Stat after the open: creating the manifest file itself
+                # bumps the folder mtime, and that is the value future runs
+                # will compare against
+                json.dump({'mtime': os.stat(folder).st_mtime,
+                           'sub_mtimes': sub_mtimes,
+                           'files': paths}, f)
+        except OSError:
+            pass  # Read-only corpus: fall back to scanning every run
+
+        return paths
     
     def setup_gui(self):
         """Set up the main GUI layout"""
@@ -102,6 +246,11 @@ class GomokuVisualizer:
         # Game info frame
         self.info_frame = ttk.LabelFrame(middle_frame, text="Game Information")
         self.info_frame.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 10))
+
+        # Current-turn labels are backed by StringVars so per-move updates
+        # are two .set() calls instead of destroying and rebuilding widgets
+        self._turn_player_var = tk.StringVar()
+        self._turn_move_var = tk.StringVar()
         
         # Board canvas
         canvas_frame = ttk.LabelFrame(middle_frame, text="Game Board")
@@ -148,55 +297,43 @@ class GomokuVisualizer:
         # Make sure the root window can receive focus for key events
         self.root.focus_set()
         
-        # Bind keyboard shortcuts
-        self.root.bind('<Left>', lambda e: self.previous_move())
-        self.root.bind('<Right>', lambda e: self.next_move())
-        
+        # Bind keyboard shortcuts; single-step keys go through _nudge so OS
+        # autorepeat coalesces into one board update per tick
+        self.root.bind('<Left>', lambda e: self._nudge(-1))
+        self.root.bind('<Right>', lambda e: self._nudge(1))
+
         # Mac equivalent shortcuts for Home/End
-        self.root.bind('<Command-Left>', lambda e: self.go_to_first())   # ⌘+← 
+        self.root.bind('<Command-Left>', lambda e: self.go_to_first())   # ⌘+←
         self.root.bind('<Command-Right>', lambda e: self.go_to_last())   # ⌘+→
-        
+
         # Alternative number keys for quick access
         self.root.bind('<1>', lambda e: self.go_to_first())     # 1 for first
         self.root.bind('<0>', lambda e: self.go_to_last())      # 0 for last
-        
+
         # WASD style navigation
-        self.root.bind('<a>', lambda e: self.previous_move())  # A for previous
-        self.root.bind('<d>', lambda e: self.next_move())     # D for next
-        self.root.bind('<space>', lambda e: self.next_move()) # Space for next
+        self.root.bind('<a>', lambda e: self._nudge(-1))  # A for previous
+        self.root.bind('<d>', lambda e: self._nudge(1))   # D for next
+        self.root.bind('<space>', lambda e: self._nudge(1))  # Space for next
     
     def load_available_games(self):
         """Load all available JSON game files from the current folder"""
-        # Look for JSON files in the selected folder
-        json_files = []
         folder_path = self.current_folder
-        
-        if os.path.exists(folder_path):
-            # For qwen3 and gpt5 folders, JSON files are directly in the folder
-            if folder_path in ["qwen3", "gpt5"]:
-                pattern = os.path.join(folder_path, "*.json")
-                json_files = glob.glob(pattern)
-            else:
-                # For other folders, JSON files are in subdirectories
-                pattern = os.path.join(folder_path, "*", "*.json")
-                json_files = glob.glob(pattern)
-        
+        json_files = self._scan_games(folder_path)
+
         if not json_files:
             # Fallback: look in current directory
-            json_files = glob.glob("*.json")
-        
+            json_files = sorted(glob.glob("*.json"))
+
         # Create display names for combobox
         game_options = []
         self.game_files = {}
-        
-        for file_path in sorted(json_files):
-            # Extract meaningful name from filename
+
+        for file_path in json_files:
+            # Extract meaningful name from filename: drop the .json suffix and
+            # swap underscores for spaces in one C-level translate pass
             filename = os.path.basename(file_path)
-            # Remove .json extension
-            display_name = filename.replace('.json', '')
-            # Replace underscores with spaces for better readability
-            display_name = display_name.replace('_', ' ')
-            
+            display_name = filename.removesuffix('.json').translate(_UND_TBL)
+
             game_options.append(display_name)
             self.game_files[display_name] = file_path
         
@@ -211,8 +348,13 @@ class GomokuVisualizer:
             self.game_combobox.set("")
             # Clear the board and info if no games found
             self.game_data = None
+            self._moves = []
+            self._n_moves = 0
+            self._move_cells = []
+            self._move_tags = ()
             self.current_move_index = 0
             self.reset_board()
+            self._clear_stones()
             self.draw_board()
             self.update_buttons()
             # Clear game info
@@ -240,31 +382,88 @@ class GomokuVisualizer:
             self.load_game(self.game_files[selected_game])
     
     def load_game(self, file_path: str):
-        """Load game data from JSON file"""
+        """Load game data from JSON file without blocking the UI"""
+        # Reading and parsing happen on the worker thread (the GIL is
+        # released during the file read); only widget updates stay here
+        self._load_generation += 1
+        generation = self._load_generation
+        future = self._io_pool.submit(self._parse_game_file, file_path)
+        self.root.after(20, lambda: self._check_load(future, generation))
+
+    def _parse_game_file(self, file_path: str):
+        """Worker-thread half of load_game: parse and pre-resolve moves"""
+        with open(file_path, 'rb') as f:
+            game_data = _loads(f.read())
+
+        # Pre-resolve each move's cell index, stone code and number once,
+        # so navigation never repeats per-move dict lookups
+        size = self.board_size
+        moves = game_data.get('moves') or []
+        move_cells = [
+            ((size - move['row']) * size + BOARD_COL_TO_INDEX[move['column']],
+             _BLACK_CODE if move['player'] == 'B' else _WHITE_CODE,
+             move.get('move_number', i + 1))
+            for i, move in enumerate(moves)
+        ]
+        return game_data, moves, move_cells
+
+    def _check_load(self, future, generation: int):
+        """Poll a pending load and install the result on the main thread"""
+        if generation != self._load_generation:
+            return  # A newer selection superseded this load
+        if not future.done():
+            self.root.after(20, lambda: self._check_load(future, generation))
+            return
+
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                self.game_data = json.load(f)
-            
-            self.current_move_index = 0
-            self.reset_board()
-            self.update_info_display()
-            self.update_board_to_move(0)
-            self.update_buttons()
-            
+            game_data, moves, move_cells = future.result()
         except Exception as e:
             messagebox.showerror("Error Loading Game", f"Failed to load game file:\n{str(e)}")
+            return
+
+        self.game_data = game_data
+        # Cache the move list and its length; navigation paths touch them
+        # several times per step
+        self._moves = moves
+        self._n_moves = len(moves)
+        self._move_cells = move_cells
+        self._move_tags = tuple(f'm{i}' for i in range(len(moves)))
+
+        self.current_move_index = 0
+        self.reset_board()
+        if not self._static_drawn:
+            self._draw_static_board()
+            self._static_drawn = True
+        self._create_all_stones()
+        self.update_info_display()
+        self.update_board_to_move(0)
+        self.update_buttons()
     
     def reset_board(self):
         """Reset board to empty state"""
-        self.board_state = [['.' for _ in range(self.board_size)] for _ in range(self.board_size)]
-        self.move_numbers = [[0 for _ in range(self.board_size)] for _ in range(self.board_size)]
-        self.winning_positions = []
+        # Zeroing the flat buffers is two C-level memsets, no reallocation
+        self.board_state[:] = bytes(len(self.board_state))
+        self.move_numbers[:] = bytes(len(self.move_numbers))
+        self.winning_positions = frozenset()
+        self._undo_stack = []
+
+    def _apply_move(self, i: int):
+        """Apply move i to the board state and remember how to undo it"""
+        cell, code, number = self._move_cells[i]
+        self.board_state[cell] = code
+        self.move_numbers[cell] = number
+        self._undo_stack.append(cell)
+
+    def _undo_move(self):
+        """Undo the most recently applied move"""
+        cell = self._undo_stack.pop()
+        self.board_state[cell] = _EMPTY_CODE
+        self.move_numbers[cell] = 0
     
     def coord_to_indices(self, col: str, row: int) -> Tuple[int, int]:
         """Convert board coordinates to array indices"""
-        col_idx = BOARD_COL_TO_INDEX[col]
-        row_idx = self.board_size - row  # Convert to 0-based from bottom
-        return row_idx, col_idx
+        # O(1) lookup in the shared precomputed column table
+        return self.board_size - row, BOARD_COL_TO_INDEX[col]
     
     def update_info_display(self):
         """Update the game information display"""
@@ -314,7 +513,7 @@ class GomokuVisualizer:
         ttk.Label(self.info_frame, text="GAME RESULT", font=('Arial', 10, 'bold')).pack(anchor=tk.W, padx=5, pady=2)
         
         winner = result.get('winner', 'In Progress')
-        total_moves = result.get('total_moves', len(self.game_data.get('moves', [])))
+        total_moves = result.get('total_moves', self._n_moves)
         
         ttk.Label(self.info_frame, text=f"Winner: {winner}").pack(anchor=tk.W, padx=5, pady=1)
         ttk.Label(self.info_frame, text=f"Total Moves: {total_moves}").pack(anchor=tk.W, padx=5, pady=1)
@@ -332,215 +531,338 @@ class GomokuVisualizer:
         reason_text.insert(tk.END, end_reason)
         reason_text.config(state=tk.DISABLED)
         
-        # Current turn info
-        if self.game_data.get('moves'):
+        # Current turn info: persistent labels bound to StringVars, refreshed
+        # in place on every move
+        if self._moves:
             ttk.Separator(self.info_frame, orient='horizontal').pack(fill=tk.X, padx=5, pady=5)
             ttk.Label(self.info_frame, text="CURRENT TURN", font=('Arial', 10, 'bold')).pack(anchor=tk.W, padx=5, pady=2)
+            turn_frame = ttk.Frame(self.info_frame)
+            turn_frame.pack(fill=tk.X, padx=5, pady=2)
+            ttk.Label(turn_frame, textvariable=self._turn_player_var).pack(anchor=tk.W)
+            ttk.Label(turn_frame, textvariable=self._turn_move_var).pack(anchor=tk.W)
             self.update_current_turn_info()
-    
+
     def update_current_turn_info(self):
         """Update current turn information in the info panel"""
-        # Remove existing current turn info
-        children = self.info_frame.winfo_children()
-        for i, child in enumerate(children):
-            if hasattr(child, 'current_turn_marker'):
-                for j in range(i, len(children)):
-                    if children[j].winfo_exists():
-                        children[j].destroy()
-                break
-        
-        if not self.game_data or not self.game_data.get('moves'):
+        if not self._moves:
+            self._turn_player_var.set("")
+            self._turn_move_var.set("")
             return
-        
-        moves = self.game_data['moves']
-        
-        # Create frame for current turn info
-        turn_frame = ttk.Frame(self.info_frame)
-        turn_frame.pack(fill=tk.X, padx=5, pady=2)
-        turn_frame.current_turn_marker = True  # Mark this frame
-        
-        if self.current_move_index < len(moves):
-            current_move = moves[self.current_move_index]
-            
+
+        if self.current_move_index < self._n_moves:
+            current_move = self._moves[self.current_move_index]
             player_symbol = "⚫" if current_move['player'] == 'B' else "⚪"
-            player_name = current_move['player_name']
-            coordinate = current_move['coordinate']
-            move_num = current_move['move_number']
-            
-            ttk.Label(turn_frame, text=f"{player_symbol} {player_name}").pack(anchor=tk.W)
-            ttk.Label(turn_frame, text=f"Move {move_num}: {coordinate}").pack(anchor=tk.W)
+            self._turn_player_var.set(f"{player_symbol} {current_move['player_name']}")
+            self._turn_move_var.set(
+                f"Move {current_move['move_number']}: {current_move['coordinate']}")
         else:
-            ttk.Label(turn_frame, text="Game Complete").pack(anchor=tk.W)
+            self._turn_player_var.set("Game Complete")
+            self._turn_move_var.set("")
     
     def draw_board(self):
-        """Draw the Gomoku board with 15x15 grid lines"""
-        self.canvas.delete("all")
-        
+        """Draw the Gomoku board and sync stones to the current state"""
+        if not self._static_drawn:
+            self._draw_static_board()
+            self._static_drawn = True
+
+        self.draw_stones()
+
+    def _draw_static_board(self):
+        """Create the static grid lines and axis labels (once)"""
+        if _HAS_PIL:
+            self._render_static_background()
+            return
+
         # Board background - center the board in the canvas
         board_x, board_y = self.board_origin
         # Calculate board size based on 14 intervals between 15 lines
         board_width = (self.board_size - 1) * self.cell_size
         board_height = (self.board_size - 1) * self.cell_size
-        
+
+        # Every static element is emitted as one Tcl script and evaluated in
+        # a single interpreter call instead of ~91 Python-to-Tk round-trips
+        cv = str(self.canvas)
+        line_color = self.colors['board_line']
+        font_name = self._fonts[12].name
+
         # Create background without border (棋盘背景，无边框)
-        self.canvas.create_rectangle(
-            board_x, board_y, 
-            board_x + board_width, board_y + board_height,
-            fill=self.colors['empty'], outline=""
-        )
-        
+        cmds = [
+            f"{cv} create rectangle {board_x} {board_y} "
+            f"{board_x + board_width} {board_y + board_height} "
+            f"-fill {self.colors['empty']} -outline {{}}"
+        ]
+
         # Draw 15 grid lines (0 to 14 indices, representing A-O and 1-15)
         for i in range(self.board_size):
             # Vertical lines (A to O)
             x = board_x + i * self.cell_size
-            self.canvas.create_line(
-                x, board_y, x, board_y + board_height,
-                fill=self.colors['board_line'], width=1
-            )
-            
+            cmds.append(f"{cv} create line {x} {board_y} "
+                        f"{x} {board_y + board_height} -fill {line_color} -width 1")
+
             # Horizontal lines (1 to 15)
             y = board_y + i * self.cell_size
-            self.canvas.create_line(
-                board_x, y, board_x + board_width, y,
-                fill=self.colors['board_line'], width=1
-            )
-        
-        # Column labels (A-O) - aligned with grid intersections - 上方
-        for i, col in enumerate(self.columns):
-            x = board_x + i * self.cell_size  # Align with grid lines
-            self.canvas.create_text(x, board_y - 20, text=col, font=('Arial', 12, 'bold'), fill='black')
-        
-        # Column labels (A-O) - aligned with grid intersections - 下方（从左到右A-O）
+            cmds.append(f"{cv} create line {board_x} {y} "
+                        f"{board_x + board_width} {y} -fill {line_color} -width 1")
+
+        # Column labels (A-O) above and below, aligned with grid lines
+        # （上方和下方，从左到右A-O）
         for i, col in enumerate(self.columns):
-            x = board_x + i * self.cell_size  # Align with grid lines
-            self.canvas.create_text(x, board_y + board_height + 20, text=col, font=('Arial', 12, 'bold'), fill='black')
-        
-        # Row labels (1-15) - aligned with grid intersections - 左侧
+            x = board_x + i * self.cell_size
+            cmds.append(f"{cv} create text {x} {board_y - 20} "
+                        f"-text {col} -font {font_name} -fill black")
+            cmds.append(f"{cv} create text {x} {board_y + board_height + 20} "
+                        f"-text {col} -font {font_name} -fill black")
+
+        # Row labels (1-15) on both sides, aligned with grid lines
+        # （左侧和右侧，从下到上1-15）
         for i in range(self.board_size):
             row_num = self.board_size - i
-            y = board_y + i * self.cell_size  # Align with grid lines
-            self.canvas.create_text(board_x - 25, y, text=str(row_num), font=('Arial', 12, 'bold'), fill='black')
-        
-        # Row labels (1-15) - aligned with grid intersections - 右侧（从下到上1-15）
+            y = board_y + i * self.cell_size
+            cmds.append(f"{cv} create text {board_x - 25} {y} "
+                        f"-text {row_num} -font {font_name} -fill black")
+            cmds.append(f"{cv} create text {board_x + board_width + 25} {y} "
+                        f"-text {row_num} -font {font_name} -fill black")
+
+        self.canvas.tk.eval("\n".join(cmds))
+
+    def _render_static_background(self):
+        """Pre-render the static board to one off-screen image and blit it"""
+        from PIL import ImageFont
+
+        board_x, board_y = self.board_origin
+        board_width = (self.board_size - 1) * self.cell_size
+        board_height = (self.board_size - 1) * self.cell_size
+        img_width = board_width + 100
+        img_height = board_height + 90
+
+        image = Image.new('RGB', (img_width, img_height), 'white')
+        draw = ImageDraw.Draw(image)
+
+        try:
+            font = ImageFont.truetype("DejaVuSans-Bold.ttf", 14)
+        except OSError:
+            font = ImageFont.load_default()
+
+        # Board background (no border)
+        draw.rectangle(
+            [board_x, board_y, board_x + board_width, board_y + board_height],
+            fill=self.colors['empty']
+        )
+
+        # 15 vertical + 15 horizontal grid lines
         for i in range(self.board_size):
-            row_num = self.board_size - i
-            y = board_y + i * self.cell_size  # Align with grid lines
-            self.canvas.create_text(board_x + board_width + 25, y, text=str(row_num), font=('Arial', 12, 'bold'), fill='black')
-        
-        # Draw stones
-        self.draw_stones()
-    
-    def draw_stones(self):
-        """Draw stones on the board"""
+            x = board_x + i * self.cell_size
+            draw.line([x, board_y, x, board_y + board_height],
+                      fill=self.colors['board_line'], width=1)
+            y = board_y + i * self.cell_size
+            draw.line([board_x, y, board_x + board_width, y],
+                      fill=self.colors['board_line'], width=1)
+
+        # Column labels (A-O) above and below, row labels (1-15) on both sides
+        for i, col in enumerate(self.columns):
+            x = board_x + i * self.cell_size
+            draw.text((x, board_y - 20), col, fill='black', font=font, anchor='mm')
+            draw.text((x, board_y + board_height + 20), col, fill='black', font=font, anchor='mm')
+        for i in range(self.board_size):
+            row_label = str(self.board_size - i)
+            y = board_y + i * self.cell_size
+            draw.text((board_x - 25, y), row_label, fill='black', font=font, anchor='mm')
+            draw.text((board_x + board_width + 25, y), row_label, fill='black', font=font, anchor='mm')
+
+        # Keep a reference so Tk doesn't garbage-collect the image
+        self._bg_img = ImageTk.PhotoImage(image)
+        self.canvas.create_image(0, 0, anchor='nw', image=self._bg_img)
+
+    def _build_stone_templates(self):
+        """Prepare the Tcl command templates used to create stone items"""
+        cv = str(self.canvas)
+        self._oval_tmpl = cv + " create oval %d %d %d %d -fill %s -outline %s -width 2"
+        self._text_tmpl = cv + " create text %d %d -text %d -fill %s -font %s"
+
+    def _stone_commands(self, row: int, col: int, stone: int,
+                        move_num: int) -> Tuple[str, Optional[str]]:
+        """Build the Tcl create commands for one stone's oval and text"""
         board_x, board_y = self.board_origin
         stone_radius = self.cell_size // 2.5  # Increased from // 3 to make stones larger
-        columns = self.columns
-        
-        last_move_pos = None
-        if (self.game_data and self.current_move_index > 0 and 
-            self.current_move_index <= len(self.game_data.get('moves', []))):
-            last_move = self.game_data['moves'][self.current_move_index - 1]
-            last_move_pos = (last_move['column'], last_move['row'])
-        
-        for row in range(self.board_size):
-            for col in range(self.board_size):
-                stone = self.board_state[row][col]
-                if stone in ['B', 'W']:
-                    # Calculate position - place stones on grid line intersections
-                    x = board_x + col * self.cell_size
-                    y = board_y + row * self.cell_size
-                    
-                    # Determine colors
-                    stone_color = self.colors['black'] if stone == 'B' else self.colors['white']
-                    outline_color = self.colors['white'] if stone == 'B' else self.colors['black']
-                    
-                    # Check if this is a winning stone
-                    current_col = columns[col]
-                    current_row = self.board_size - row
-                    
-                    is_winning = (current_col, current_row) in self.winning_positions
-                    is_last_move = (current_col, current_row) == last_move_pos
-                    
-                    # Draw stone
-                    oval = self.canvas.create_oval(
-                        x - stone_radius, y - stone_radius,
-                        x + stone_radius, y + stone_radius,
-                        fill=stone_color, outline=outline_color, width=2
-                    )
-                    
-                    # Draw move number on the stone
-                    move_num = self.move_numbers[row][col]
-                    if move_num > 0:
-                        # Choose text color based on stone color
-                        text_color = self.colors['white'] if stone == 'B' else self.colors['black']
-                        
-                        # Determine font size based on move number
-                        if move_num < 10:
-                            font_size = 14
-                        elif move_num < 100:
-                            font_size = 12
-                        else:
-                            font_size = 10
-                        
-                        self.canvas.create_text(
-                            x, y, 
-                            text=str(move_num),
-                            fill=text_color,
-                            font=('Arial', font_size, 'bold')
-                        )
-                    
-                    # Highlight winning stones or last move
-                    if is_winning:
-                        self.canvas.create_oval(
-                            x - stone_radius - 3, y - stone_radius - 3,
-                            x + stone_radius + 3, y + stone_radius + 3,
-                            outline=self.colors['winning_stone'], width=3, fill=""
-                        )
-                    elif is_last_move:
-                        self.canvas.create_oval(
-                            x - stone_radius - 2, y - stone_radius - 2,
-                            x + stone_radius + 2, y + stone_radius + 2,
-                            outline=self.colors['last_move'], width=2, fill=""
-                        )
+
+        # Calculate position - place stones on grid line intersections
+        x = board_x + col * self.cell_size
+        y = board_y + row * self.cell_size
+
+        # Determine colors
+        is_black = stone == _BLACK_CODE
+        stone_color = self._stone_fill[stone]
+        outline_color = self.colors['white'] if is_black else self.colors['black']
+
+        oval_cmd = self._oval_tmpl % (x - stone_radius, y - stone_radius,
+                                      x + stone_radius, y + stone_radius,
+                                      stone_color, outline_color)
+
+        # Draw move number on the stone
+        text_cmd = None
+        if move_num > 0:
+            # Choose text color based on stone color
+            text_color = self.colors['white'] if is_black else self.colors['black']
+
+            # Determine font size based on move number
+            if move_num < 10:
+                font_size = 14
+            elif move_num < 100:
+                font_size = 12
+            else:
+                font_size = 10
+
+            text_cmd = self._text_tmpl % (x, y, move_num, text_color,
+                                          self._fonts[font_size].name)
+
+        return oval_cmd, text_cmd
+
+    def _clear_stones(self):
+        """Delete every stone item and reset visibility/highlight tracking"""
+        self.canvas.delete('stone')
+        self._stone_items = {}
+        self._currently_highlighted = {}
+        self._visible_upto = 0
+
+    def _create_all_stones(self):
+        """
+        Create one hidden oval + move-number text per move of the loaded
+        game, tagged m{i}, so navigation only toggles item state instead of
+        creating and deleting canvas items
+        """
+        self._clear_stones()
+        if not self._move_cells:
+            return
+        if self._oval_tmpl is None:
+            self._build_stone_templates()
+
+        size = self.board_size
+        # lappend collects every created oval ID; eval returns the last
+        # command's result, so the script ends with "set __ids" to hand the
+        # full list back after one round-trip
+        lines = ["set __ids {}"]
+        for i, (cell, code, number) in enumerate(self._move_cells):
+            row, col = divmod(cell, size)
+            oval_cmd, text_cmd = self._stone_commands(row, col, code, number)
+            suffix = f" -state hidden -tags {{m{i} stone}}"
+            if text_cmd:
+                lines.append(f"lappend __ids [{oval_cmd}{suffix}]"
+                             f"\n{text_cmd}{suffix}")
+            else:
+                lines.append(f"lappend __ids [{oval_cmd}{suffix}]")
+        lines.append("set __ids")
+        ids = self.canvas.tk.eval("\n".join(lines)).split()
+
+        for (cell, code, _), oval_id in zip(self._move_cells, ids):
+            self._stone_items[divmod(cell, size)] = (int(oval_id), code)
+
+    def draw_stones(self):
+        """Sync stone visibility and highlights with the current position"""
+        itemconfigure = self.canvas.itemconfigure
+
+        # Show or hide only the delta of moves since the last sync, reusing
+        # the tag strings built at load time
+        target = self.current_move_index
+        tags = self._move_tags
+        if target > self._visible_upto:
+            for i in range(self._visible_upto, target):
+                itemconfigure(tags[i], state='normal')
+        elif target < self._visible_upto:
+            for i in range(target, self._visible_upto):
+                itemconfigure(tags[i], state='hidden')
+        self._visible_upto = target
+
+        # Winning/last-move highlights are applied by reconfiguring the
+        # existing stone ovals' outlines, not by stacking extra items
+        size = self.board_size
+        new_highlights = {}
+        for col, row in self.winning_positions:
+            key = (size - row, BOARD_COL_TO_INDEX[col])
+            new_highlights[key] = (self.colors['winning_stone'], 3)
+        if 0 < target <= self._n_moves:
+            last_move = self._moves[target - 1]
+            key = (size - last_move['row'], BOARD_COL_TO_INDEX[last_move['column']])
+            if key not in new_highlights:
+                new_highlights[key] = (self.colors['last_move'], 3)
+
+        # Restore the plain outline on stones that dropped out of the
+        # highlight set, then recolor the ones that entered or changed
+        for key in self._currently_highlighted.keys() - new_highlights.keys():
+            item = self._stone_items.get(key)
+            if item is not None:
+                oval_id, code = item
+                plain = (self.colors['white'] if code == _BLACK_CODE
+                         else self.colors['black'])
+                itemconfigure(oval_id, outline=plain, width=2)
+        for key, (color, width) in new_highlights.items():
+            item = self._stone_items.get(key)
+            if item is not None and self._currently_highlighted.get(key) != (color, width):
+                itemconfigure(item[0], outline=color, width=width)
+        self._currently_highlighted = new_highlights
     
     def update_board_to_move(self, move_index: int):
         """Update board state to show position after given move index"""
-        self.reset_board()
-        
-        if not self.game_data or not self.game_data.get('moves'):
-            self.draw_board()
+        if not self._moves:
+            self.reset_board()
+            self._schedule_redraw()
             return
-        
-        moves = self.game_data['moves']
-        
-        # Apply moves up to the current index
-        for i in range(min(move_index, len(moves))):
-            move = moves[i]
-            col = move['column']
-            row = move['row']
-            player = move['player']
-            move_num = move.get('move_number', i + 1)  # Get move number or use index + 1
-            
-            row_idx, col_idx = self.coord_to_indices(col, row)
-            self.board_state[row_idx][col_idx] = player
-            self.move_numbers[row_idx][col_idx] = move_num
-        
+
+        move_index = max(0, min(move_index, self._n_moves))
+
+        # Apply or undo only the delta from the current position instead of
+        # replaying from move 0 (len(_undo_stack) always equals the number of
+        # applied moves)
+        applied = len(self._undo_stack)
+        if move_index >= applied:
+            for i in range(applied, move_index):
+                self._apply_move(i)
+        else:
+            for _ in range(applied - move_index):
+                self._undo_move()
+
         # Check if we're at the end and there's a winning line
-        if (move_index == len(moves) and 
+        if (move_index == self._n_moves and
             self.game_data.get('result', {}).get('winning_line')):
             winning_line = self.game_data['result']['winning_line']
-            self.winning_positions = [(pos['column'], pos['row']) for pos in winning_line]
+            self.winning_positions = frozenset(
+                (pos['column'], pos['row']) for pos in winning_line)
         else:
-            self.winning_positions = []
+            self.winning_positions = frozenset()
         
         self.current_move_index = move_index
+        self._schedule_redraw()
+
+    def _nudge(self, delta: int):
+        """Accumulate a keyboard navigation step, coalescing autorepeat"""
+        self._pending_delta += delta
+        if not self._tick_scheduled:
+            self._tick_scheduled = True
+            self.root.after(16, self._flush_nudge)
+
+    def _flush_nudge(self):
+        """Apply the accumulated keyboard delta in one incremental update"""
+        self._tick_scheduled = False
+        delta = self._pending_delta
+        self._pending_delta = 0
+        if delta and self.game_data:
+            # update_board_to_move clamps to [0, total_moves]
+            self.update_board_to_move(self.current_move_index + delta)
+
+    def _schedule_redraw(self):
+        """Queue a single redraw for the next idle cycle"""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.root.after_idle(self._do_redraw)
+
+    def _do_redraw(self):
+        """Repaint stones and dependent widgets from the current state"""
+        self._redraw_pending = False
         self.draw_board()
         self.update_buttons()
         self.update_current_turn_info()
-        
+
         # Update move counter
-        total_moves = len(moves)
-        self.move_label.config(text=f"Move: {move_index}/{total_moves}")
+        self.move_label.config(text=f"Move: {self.current_move_index}/{self._n_moves}")
     
     def update_buttons(self):
         """Update button states based on current position"""
@@ -551,9 +873,9 @@ class GomokuVisualizer:
             self.btn_next.config(state=tk.DISABLED)
             self.btn_last.config(state=tk.DISABLED)
             return
-        
-        total_moves = len(self.game_data.get('moves', []))
-        
+
+        total_moves = self._n_moves
+
         # First and Previous buttons
         if self.current_move_index <= 0:
             self.btn_first.config(state=tk.DISABLED)
@@ -581,14 +903,13 @@ class GomokuVisualizer:
     
     def next_move(self):
         """Go to next move"""
-        if self.game_data and self.current_move_index < len(self.game_data.get('moves', [])):
+        if self.current_move_index < self._n_moves:
             self.update_board_to_move(self.current_move_index + 1)
     
     def go_to_last(self):
         """Go to end of game"""
         if self.game_data:
-            total_moves = len(self.game_data.get('moves', []))
-            self.update_board_to_move(total_moves)
+            self.update_board_to_move(self._n_moves)
 
 
 def main():
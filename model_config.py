@@ -2,9 +2,37 @@
 Multi-model configuration and management for different AI providers
 """
 import os
+import httpx
 import openai
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
+
+# Async clients are cached per (provider, api_key, base_url) and share one
+# connection-pooled transport, so TLS handshakes happen once per provider
+# instead of once per player or game
+_CLIENT_CACHE: Dict[tuple, openai.AsyncOpenAI] = {}
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _shared_http_client() -> httpx.AsyncClient:
+    """Get the process-wide pooled HTTP client, creating it on first use"""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100))
+    return _http_client
+
+
+async def close_all():
+    """Close every cached API client and the shared connection pool"""
+    global _http_client
+    for client in _CLIENT_CACHE.values():
+        await client.close()
+    _CLIENT_CACHE.clear()
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
 
 
 @dataclass
@@ -16,12 +44,17 @@ class ModelConfig:
     base_url: str
     extra_body: Optional[Dict[str, Any]] = None
     
-    def create_client(self) -> openai.OpenAI:
-        """Create an OpenAI-compatible client for this model"""
-        return openai.OpenAI(
-            api_key=self.api_key,
-            base_url=self.base_url
-        )
+    def create_client(self) -> openai.AsyncOpenAI:
+        """Get the shared async OpenAI-compatible client for this model"""
+        key = (self.provider, self.api_key, self.base_url)
+        client = _CLIENT_CACHE.get(key)
+        if client is None:
+            client = _CLIENT_CACHE.setdefault(key, openai.AsyncOpenAI(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                http_client=_shared_http_client()
+            ))
+        return client
     
     def get_chat_completion_kwargs(self) -> Dict[str, Any]:
         """Get additional kwargs for chat completion requests"""
@@ -48,36 +81,38 @@ class ModelManager:
     }
     
     def __init__(self):
-        """Initialize model manager from environment variables"""
-        self.configs: Dict[str, Dict[str, str]] = self._load_configurations()
-    
-    def _load_configurations(self) -> Dict[str, Dict[str, str]]:
-        """Load all available provider credentials from the environment"""
-        configs: Dict[str, Dict[str, str]] = {}
-        
-        for provider in self.PROVIDER_MODELS.keys():
+        """Initialize model manager; credentials are read lazily per provider"""
+        self._cache: Dict[str, Optional[Dict[str, str]]] = {}
+
+    def _config_for(self, provider: str) -> Optional[Dict[str, str]]:
+        """Read (and cache) one provider's credentials from the environment"""
+        if provider not in self._cache:
             api_key = os.getenv(f"{provider.upper()}_API_KEY")
             base_url = os.getenv(f"{provider.upper()}_BASE_URL")
-            
-            if api_key and base_url:
-                configs[provider] = {
-                    "api_key": api_key,
-                    "base_url": base_url
-                }
-        
-        return configs
-    
+
+            self._cache[provider] = (
+                {"api_key": api_key, "base_url": base_url}
+                if api_key and base_url else None
+            )
+
+        return self._cache[provider]
+
+    @cached_property
+    def configs(self) -> Dict[str, Dict[str, str]]:
+        """All configured providers; scans every provider on first access"""
+        return {provider: config for provider in self.PROVIDER_MODELS
+                if (config := self._config_for(provider)) is not None}
+
     def get_model_config(self, provider: str, model_name: str) -> ModelConfig:
         """Get configuration for a specific provider and model"""
-        if provider not in self.configs:
+        config_data = self._config_for(provider)
+        if config_data is None:
             raise ValueError(f"Provider '{provider}' not configured. Available: {list(self.configs.keys())}")
         
         if model_name not in self.PROVIDER_MODELS.get(provider, []):
             available_models = self.PROVIDER_MODELS.get(provider, [])
             raise ValueError(f"Model '{model_name}' not supported for provider '{provider}'. Available: {available_models}")
         
-        config_data = self.configs[provider]
-        
         # Handle provider-specific extra configurations
         extra_body = None
         if provider == "openrouter":
@@ -162,39 +197,42 @@ class ModelManager:
         return status
 
 
+# Human-readable display names per provider/model, built once at import
+_DISPLAY_NAMES = {
+    "openai": {
+        "gpt-5": "GPT-5"
+    },
+    "deepseek": {
+        "deepseek-chat": "DeepSeek V3.1"
+    },
+    "moonshot": {
+        "kimi-k2-0711-preview": "Kimi K2"
+    },
+    "zhipuai": {
+        "glm-4.5": "GLM-4.5"
+    },
+    "anthropic": {
+        "anthropic/claude-sonnet-4": "Claude Sonnet 4"
+    },
+    "google": {
+        "gemini-2.5-pro": "Gemini 2.5 Pro",
+        "gemini-2.5-flash": "Gemini 2.5 Flash"
+    },
+    "volcengine": {
+        "doubao-seed-1.6-250615": "Doubao Seed 1.6",
+        "deepseek-r1-250528": "DeepSeek R1 (Volce)",
+        "deepseek-v3-1-250821": "DeepSeek V3.1 (Volce)"
+    },
+    "stepfun": {
+        "step-3": "Step-3"
+    },
+    "openrouter": {
+        "qwen/qwen3-235b-a22b-thinking-2507": "Qwen3 235B Thinking"
+    }
+}
+
+
+@lru_cache(maxsize=None)
 def get_model_display_name(provider: str, model_name: str) -> str:
     """Get a human-readable display name for a model"""
-    display_names = {
-        "openai": {
-            "gpt-5": "GPT-5"
-        },
-        "deepseek": {
-            "deepseek-chat": "DeepSeek V3.1"
-        },
-        "moonshot": {
-            "kimi-k2-0711-preview": "Kimi K2"
-        },
-        "zhipuai": {
-            "glm-4.5": "GLM-4.5"
-        },
-        "anthropic": {
-            "anthropic/claude-sonnet-4": "Claude Sonnet 4"
-        },
-        "google": {
-            "gemini-2.5-pro": "Gemini 2.5 Pro",
-            "gemini-2.5-flash": "Gemini 2.5 Flash"
-        },
-        "volcengine": {
-            "doubao-seed-1.6-250615": "Doubao Seed 1.6",
-            "deepseek-r1-250528": "DeepSeek R1 (Volce)",
-            "deepseek-v3-1-250821": "DeepSeek V3.1 (Volce)"
-        },
-        "stepfun": {
-            "step-3": "Step-3"
-        },
-        "openrouter": {
-            "qwen/qwen3-235b-a22b-thinking-2507": "Qwen3 235B Thinking"
-        }
-    }
-    
-    return display_names.get(provider, {}).get(model_name, f"{provider}/{model_name}")
+    return _DISPLAY_NAMES.get(provider, {}).get(model_name, f"{provider}/{model_name}")